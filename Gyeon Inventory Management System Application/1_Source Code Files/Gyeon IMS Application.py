@@ -3,17 +3,35 @@ Welcome to the Source Code of GYEON Inventory Management System Application.
 
 Make sure to read this the notes before running:
 - This file uses only Python standard library (tkinter, ttk, json, os)
+- If the optional orjson package is installed it is used for faster JSON saving/loading
 - Data file is saved in ./gyeon_inventory/gyeon inventory.json relative to this script file
+- Saves after adding, updating or deleting items append those changes to
+  ./gyeon_inventory/gyeon inventory.log instead, which is replayed on load and folded
+  back into the data file when the window closes. The journal's first line records a hash
+  of the data file it applies to; a journal that does not match is never applied or deleted
 
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
+import contextlib
+import hashlib
 import json
 import os
+import sys
+import time
+import uuid
+from collections import Counter
 from functools import partial
+from itertools import groupby
+from operator import itemgetter
 from datetime import datetime
 
+try:
+    import orjson  # optional: C-implemented JSON encoder, falls back to json when missing
+except ImportError:
+    orjson = None
+
 # --------------------------------------------------------------------------------------------------------------
 # First let us configure our color palettes, this application is inspired by GYEON's branding.
 # --------------------------------------------------------------------------------------------------------------
@@ -26,12 +44,53 @@ GYEON_ACCENT = "#9C4DCC"       # lighter purple for hover/secondary
 # This is for the creation of File Directories (New: dedicated folder + filename for GYEON inventory)
 DATA_DIR = os.path.join(os.path.dirname(__file__), "gyeon_inventory")
 DATA_FILE = os.path.join(DATA_DIR, "gyeon inventory.json")
+# Append-only journal: a {"op": "base", "hash": ...} header naming the data file contents it applies to,
+# then one JSON record per line for each add/update/delete since the last full save
+JOURNAL_FILE = os.path.join(DATA_DIR, "gyeon inventory.log")
 
 # This ensures the directory exists early (safe no-op if already present)
 os.makedirs(DATA_DIR, exist_ok=True)
 
+# Delay (ms) after the last keystroke before the search bar filters the table
+FILTER_DELAY_MS = 150
+
+# Treeview columns, in the order of the values tuples shown per row
+TREE_COLUMNS = ("product_number", "name", "category", "quantity")
+
+# Per-row columns kept in step with the inventory list (struct-of-arrays): column -> value of an item.
+# The *_lower columns serve searching/filtering; the others are the normalized export summary fields.
+# self.cols also holds an "iid" column (the stable Treeview iid per row), which is assigned, not derived.
+# Category values repeat across many rows, so they are interned: equal categories share one string
+# object and the Counter/dict lookups in the summary and filters compare them by identity first.
+INDEX_COLUMNS = {
+    "name_lower": lambda it: field_text(it, "name").lower(),
+    "prodnum_lower": lambda it: field_text(it, "product_number").lower(),
+    "cat_lower": lambda it: sys.intern(field_text(it, "category").strip().lower()),
+    "product_number": lambda it: field_text(it, "product_number").strip() or "N/A",
+    "name": lambda it: field_text(it, "name").strip() or "Unnamed",
+    "category": lambda it: sys.intern(field_text(it, "category").strip() or "Uncategorized"),
+    "quantity": lambda it: to_quantity(it.get("quantity", 0)),
+    # keys of the name / product number lookups (see name_key, prodnum_key)
+    "name_key": lambda it: name_key(it),
+    "prodnum_key": lambda it: prodnum_key(it),
+}
+
+# Largest quantity accepted: orjson only encodes integers that fit in 64 bits
+MAX_QUANTITY = 2**63 - 1
+
+# Row inserts/updates/moves in one refresh above which the Treeview columns are hidden meanwhile
+BULK_RENDER_ROWS = 100
+
 # A Category ordering for custom sort
 CATEGORY_ORDER = ["Coating & Wax", "Maintenance", "Pads", "Accessories"]
+# category -> position lookup so sorting does not scan CATEGORY_ORDER per item
+CATEGORY_ORDER_INDEX = {c: i for i, c in enumerate(CATEGORY_ORDER)}
+
+# Columns sort_items accepts; name, product number and quantity sort on their index columns
+SORT_KEYS = frozenset({"name", "product_number", "quantity", "category"})
+
+# Category sort key: position in CATEGORY_ORDER (unknown categories go last)
+CATEGORY_SORT_KEY = lambda d: CATEGORY_ORDER_INDEX.get(d.get("category", ""), len(CATEGORY_ORDER))
 
 # --------------------------------------------------------------------------------------------------------------
 # ALGORITHMS: These are the core algorithms that will be used in the application. (based on the project proposal)
@@ -55,8 +114,9 @@ def bubble_sort(inventory, key="name"):
     """In-place bubble sort on inventory by 'name', 'quantity', or 'category'.
 
     This demonstrates bubble sort explicitly for teaching purposes.
-    For 'category' I use a custom order defined in CATEGORY_ORDER.
+    For 'category' I use a custom order defined in CATEGORY_ORDER (looked up via CATEGORY_ORDER_INDEX).
     """
+    unknown = len(CATEGORY_ORDER)
     n = len(inventory)
     for i in range(n):
         swapped = False
@@ -78,57 +138,242 @@ def bubble_sort(inventory, key="name"):
                     inventory[j], inventory[j + 1] = inventory[j + 1], inventory[j]
                     swapped = True
             elif key == "category":
-                # map categories to order indices; unknown categories go last
-                def cat_index(val):
-                    try:
-                        return CATEGORY_ORDER.index(str(val))
-                    except Exception:
-                        return len(CATEGORY_ORDER)
-                if cat_index(a) > cat_index(b):
+                # map categories to order indices with an O(1) dict lookup; unknown categories go last
+                if CATEGORY_ORDER_INDEX.get(str(a), unknown) > CATEGORY_ORDER_INDEX.get(str(b), unknown):
                     inventory[j], inventory[j + 1] = inventory[j + 1], inventory[j]
                     swapped = True
         if not swapped:
             break
 
+
+def argsort(keys):
+    """Returns the positions of keys in (stable) sorted order, like numpy.argsort.
+
+    Sorting positions instead of the items lets several parallel lists be
+    reordered the same way afterwards.
+    """
+    return sorted(range(len(keys)), key=keys.__getitem__)
+
 # --------------------------------------------------------------------------------------------------------------
 # UTILITIES: These functions are resporible for handling storage of data to/from files.
 # --------------------------------------------------------------------------------------------------------------
 
+def dump_json(obj, indent=True):
+    """Serializes obj to UTF-8 JSON bytes, 2-space indented unless indent is False.
+
+    dump_json/load_json are the only places that pick the JSON library (orjson if
+    installed, else json), so it can be swapped without touching the callers.
+    datetime values are written as ISO 8601 to the second (orjson formats them natively).
+    """
+    if orjson is not None:
+        option = orjson.OPT_OMIT_MICROSECONDS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default).encode("utf-8")
+
+def _json_default(obj):
+    """json fallback for types it cannot encode itself, matching orjson's datetime output."""
+    if isinstance(obj, datetime):
+        return obj.isoformat(timespec="seconds")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def load_json(raw):
+    """Parses JSON from bytes (or str) with orjson if installed, else json."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def content_hash(data):
+    """Returns a short digest of serialized file contents (used to skip rewriting identical data)."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
 def save_to_file(path, inventory):
     """This saves inventory list to JSON file atomically where possible.
 
     This ensures the containing directory exists and writes safely via a temp file.
     """
+    # serialize once up front, then write the bytes with a single call
+    write_atomic(path, dump_json(inventory))
+
+def write_atomic(path, data):
+    """Writes already-serialized bytes to path via a temp file and os.replace.
+
+    This ensures the containing directory exists, so a crash mid-write never leaves a half-written file.
+    """
     # This ensures the directory exists for the target path
     os.makedirs(os.path.dirname(path), exist_ok=True)
     try:
         tmp = path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(inventory, f, indent=2)
+        with open(tmp, "wb") as f:
+            f.write(data)
         os.replace(tmp, path)
     except Exception:
         # The fallback to direct write will raise to caller if it fails
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(inventory, f, indent=2)
+        with open(path, "wb") as f:
+            f.write(data)
+
+def save_append(path, ops, data_path):
+    """Appends the given (op, index, item) changes to the journal file, one JSON record per line.
+
+    "add" appends item, "update" replaces the row at index with item and "delete" removes
+    the row at index. Only the new records are written, so the cost does not depend on
+    the inventory size. A new journal starts with a header holding the hash of data_path,
+    the data file the records apply to (see journal_is_current).
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    lines = []
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        with open(data_path, "rb") as f:
+            base = content_hash(f.read()).hex()
+        lines.append(dump_json({"op": "base", "hash": base}, indent=False) + b"\n")
+    for op, index, item in ops:
+        rec = {"op": op}
+        if op != "add":
+            rec["index"] = index
+        if item is not None:
+            rec["item"] = item
+        lines.append(dump_json(rec, indent=False) + b"\n")
+    with open(path, "ab") as f:
+        f.write(b"".join(lines))
+
+def journal_base(journal):
+    """Returns the data file hash recorded in the journal's header line, or None if there is none."""
+    try:
+        with open(journal, "rb") as f:
+            rec = load_json(f.readline())
+    except (OSError, ValueError):
+        return None
+    return rec.get("hash") if isinstance(rec, dict) and rec.get("op") == "base" else None
+
+def journal_is_current(path, journal, data=None):
+    """True if the journal exists and was started on exactly the current contents of the data file.
+
+    The contents are compared by hash, not by modification time, so touching or re-syncing an
+    unchanged data file keeps the journal valid. data may pass the file's bytes if already read.
+    """
+    base = journal_base(journal)
+    if base is None:
+        return False
+    if data is None:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return False
+    return content_hash(data).hex() == base
+
+def replay_journal(journal, rows):
+    """Applies the journal records to the loaded rows list in place, in the order they were written.
+
+    A torn last line (e.g. the app was killed mid-write) ends the replay.
+    """
+    with open(journal, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                rec = load_json(line)
+            except ValueError:
+                break
+            op, index, item = rec.get("op"), rec.get("index"), rec.get("item")
+            if op == "add" and isinstance(item, dict):
+                rows.append(item)
+            elif op == "update" and isinstance(item, dict) and isinstance(index, int) and 0 <= index < len(rows):
+                rows[index] = item
+            elif op == "delete" and isinstance(index, int) and 0 <= index < len(rows):
+                del rows[index]
+
+def compact_journal(path, journal):
+    """Folds the journal into the data file with one full atomic write, then removes it.
+
+    A journal that does not match the data file is left where it is, never deleted.
+    """
+    if not journal_is_current(path, journal):
+        return
+    save_to_file(path, load_from_file(path, journal))
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(journal)
+
+def parse_quantity(text):
+    """Parses a quantity typed by the user: returns a non-negative int, or None if it is not one.
+
+    int() rejects what str.isdigit() lets through but cannot convert (e.g. superscript digits).
+    Values above MAX_QUANTITY are rejected too, since orjson cannot encode them on save.
+    """
+    try:
+        quantity = int(text)
+    except ValueError:
+        return None
+    return quantity if 0 <= quantity <= MAX_QUANTITY else None
+
+def field_text(item, key):
+    """Returns a text field of an item as str ("" if missing or null).
+
+    Older or hand-edited files may hold numbers (e.g. product_number 1001) or null
+    where text is expected; every index and lookup key goes through this.
+    """
+    value = item.get(key)
+    return "" if value is None else str(value)
+
+def name_key(item):
+    """Returns the stripped, lowercased name used by the name lookup."""
+    return field_text(item, "name").strip().lower()
+
+def prodnum_key(item):
+    """Returns the stripped product number used by the product number lookup."""
+    return field_text(item, "product_number").strip()
+
+def stored_quantity(value):
+    """Converts a quantity read from a file to int when nothing is lost (older files saved "5").
 
-def load_from_file(path):
+    Anything else ("3.0", "abc", 2.5) is returned unchanged so saving writes back what the
+    file had; such values count as 0 in the index columns (see to_quantity).
+    """
+    try:
+        quantity = int(value)
+    except (TypeError, ValueError):
+        return value
+    return quantity if isinstance(value, str) or quantity == value else value
+
+def to_quantity(value):
+    """Converts a stored quantity to int (older files saved it as a string); invalid values become 0."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+def load_from_file(path, journal=None):
     """This loads the inventory from JSON file. Returns a list (may be empty).
 
     If the file does not exist, create it with an empty list and return [].
+    If a journal path is given and it is current, its records are replayed on top.
     """
     # This ensures directory exists
     os.makedirs(os.path.dirname(path), exist_ok=True)
     if not os.path.exists(path):
         # This will create the file with an empty list so future saves/loads are predictable
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump([], f, indent=2)
+            with open(path, "wb") as f:
+                f.write(dump_json([]))
         except Exception:
             # if creation fails, just return empty inventory
             return []
         return []
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # read the bytes in one call and let the parser decode them (orjson does it in C)
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = load_json(raw)
+
+    rows = data.get("inventory") if isinstance(data, dict) else data
+    if journal and isinstance(rows, list) and journal_is_current(path, journal, raw):
+        replay_journal(journal, rows)
+
+    # Quantities are kept as int in memory where they parse. Categories repeat across many items:
+    # intern them so rows share one string object
+    if isinstance(rows, list):
+        for it in rows:
+            if isinstance(it, dict):
+                it["quantity"] = stored_quantity(it.get("quantity", 0))
+                if isinstance(it.get("category"), str):
+                    it["category"] = sys.intern(it["category"])
+    return data
 
 # --------------------------------------------------------------------------------------------------------------
 # MAIN APPLICATION CLASS: This class encapsulates the entire GUI application and its logic.
@@ -138,8 +383,49 @@ class GyeonInventoryApp:
         self.root = root
         self.root.title("GYEON Inventory Manager")
         self.root.geometry("880x700")
-        # main data structure: list of dicts {"product_number","name","category","quantity"}
+        # closing the window compacts the save journal (see _on_close)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        # main data structure: list of dicts {"product_number","name","category","quantity"} (quantity is an int)
         self.inventory = []
+        # iid -> values tuple currently shown in the Treeview (used to diff refreshes)
+        self._tree_state = {}
+        # True while <<TreeviewSelect>> events caused by programmatic refreshes should be ignored
+        self._suppress_select = False
+        # pending root.after id of the debounced search-bar filter
+        self._filter_after_id = None
+        # True while a refresh_table is queued via after_idle (see _schedule_refresh)
+        self._refresh_pending = False
+        # bumped on every inventory change; refresh_table records the version it last rendered
+        # (None while a filtered view is shown) and skips the refresh when they match
+        self._data_version = 0
+        self._rendered_version = None
+        # per-row columns (see INDEX_COLUMNS) plus "iid", each a list in the same order as self.inventory
+        self.cols = {name: [] for name in INDEX_COLUMNS}
+        self.cols["iid"] = []
+        # stripped category -> number of items in it (offered by the category filter dialog)
+        self._category_counts = Counter()
+        # stripped lowercase name -> index and stripped product number -> index (first match wins)
+        self._by_name_lower = {}
+        self._by_prodnum = {}
+        # name / product number key -> number of rows that have it, so an edit can tell whether
+        # another row still holds the old key without scanning
+        self._name_counts = Counter()
+        self._prodnum_counts = Counter()
+        # Treeview iid -> index; every row gets a stable uuid iid kept in self.cols["iid"],
+        # so the item dicts hold only the saved fields and can be written out as they are
+        self._iid_to_index = {}
+        # export summary of the current inventory, None until computed or after a change
+        self._summary_cache = None
+        # True when the inventory changed since it was last saved or loaded
+        self._dirty = False
+        # (op, index, item) changes since the last save; while only single-row changes happened,
+        # Save appends them to the journal
+        self._unsaved_ops = []
+        # True when a change other than an add happened, so Save must rewrite the whole file
+        self._needs_full_save = False
+        # (digest, mtime_ns) of the bytes last written to DATA_FILE by a full save, None when unknown;
+        # the mtime makes an edit of the file outside the app force a rewrite
+        self._last_saved_hash = None
 
         # style configuration
         self._setup_style()
@@ -151,11 +437,16 @@ class GyeonInventoryApp:
 
         # load saved data if present (this will create the file if missing)
         try:
-            self.inventory = load_from_file(DATA_FILE)
+            self.inventory = load_from_file(DATA_FILE, JOURNAL_FILE)
+            self._rebuild_indexes()
             self.refresh_table()
         except Exception:
             # ignore load errors on startup but ensure inventory starts empty
             self.inventory = []
+            self._rebuild_indexes()
+            # what is on screen is not what the file holds, so journaling changes against
+            # the file would be wrong: the first Save must rewrite it from the shown list
+            self._mark_dirty()
 
     # --------------------------------------------------------------------------------------------------------------
     # STYLING SETUP: This method configures the ttk styles for the application.
@@ -217,8 +508,9 @@ class GyeonInventoryApp:
 
         # Live date/time on the right side of the header
         self.datetime_var = tk.StringVar()
-        # initialize
-        self.datetime_var.set(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        # initialize (remember the shown text so ticks with the same text skip the Tk update)
+        self._shown_datetime = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.datetime_var.set(self._shown_datetime)
         self.datetime_label = ttk.Label(header, textvariable=self.datetime_var, style="Header.TLabel")
         self.datetime_label.pack(side=tk.RIGHT, padx=16)
         # start periodic updates
@@ -226,7 +518,11 @@ class GyeonInventoryApp:
 
     def _update_datetime(self):
         try:
-            self.datetime_var.set(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            # time.strftime formats in C without building a datetime object each tick
+            now = time.strftime("%Y-%m-%d %H:%M:%S")
+            if now != self._shown_datetime:
+                self._shown_datetime = now
+                self.datetime_var.set(now)
             # update every 1s
             self.root.after(1000, self._update_datetime)
         except Exception:
@@ -299,8 +595,7 @@ class GyeonInventoryApp:
         self.search_entry.bind("<KeyRelease>", self.realtime_filter)
 
         # Table (Treeview) with columns
-        columns = ("product_number", "name", "category", "quantity")
-        self.tree = ttk.Treeview(right, columns=columns, show="headings", selectmode="browse")
+        self.tree = ttk.Treeview(right, columns=TREE_COLUMNS, show="headings", selectmode="browse")
         self.tree.heading("product_number", text="Prod #")
         self.tree.heading("name", text="Name")
         self.tree.heading("category", text="Category")
@@ -341,44 +636,269 @@ class GyeonInventoryApp:
     # TABLE MANAGEMENT: These methods handle populating and refreshing the Treeview table.
     # --------------------------------------------------------------------------------------------------------------
     def refresh_table(self):
-        """Making it clear and repopulating the Treeview from self.inventory.
+        """Repopulating the Treeview from self.inventory.
+
+        Only rows whose values changed are touched (see _render_rows), so a refresh
+        after a single edit costs a handful of Tk calls instead of one per row, and
+        nothing at all is done when the full view is already showing this version.
+        """
+        self._refresh_pending = False
+        if self._rendered_version == self._data_version:
+            return
+        self._render_rows(zip(self.cols["iid"], map(self._row_values, self.inventory)))
+        self._rendered_version = self._data_version
 
-        This uses tree.delete and insert to refresh the visible table after data changes.
+    def _schedule_refresh(self):
+        """Queues a refresh_table for when Tk is idle, coalescing repeated requests into one.
+
+        Used after bulk changes (load, clear) so any further mutation in the same event
+        is folded into a single redraw; a direct refresh_table meanwhile cancels it.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self):
+        if self._refresh_pending:
+            self.refresh_table()
+
+    def _row_values(self, item):
+        """Returns the 4-column values tuple shown in the Treeview for an item."""
+        return (
+            item.get("product_number", ""),
+            item.get("name", ""),
+            item.get("category", ""),
+            str(item.get("quantity", 0)),
+        )
+
+    def _insert_row(self, iid, vals):
+        """Appends a single row to the Treeview without refreshing the rest."""
+        self.tree.insert("", tk.END, iid=iid, values=vals)
+        self._tree_state[iid] = vals
+
+    def _update_row(self, iid, vals):
+        """Updates a single row in place if it is currently shown and its values changed.
+
+        When only one column changed (e.g. merging quantity into an existing item) just
+        that cell is sent with tree.set instead of packing all four values.
+        """
+        old = self._tree_state.get(iid)
+        if old is None or old == vals:
+            return
+        changed = [j for j, (a, b) in enumerate(zip(old, vals)) if a != b]
+        if len(changed) == 1:
+            j = changed[0]
+            self.tree.set(iid, TREE_COLUMNS[j], vals[j])
+        else:
+            self.tree.item(iid, values=vals)
+        self._tree_state[iid] = vals
+
+    def _delete_row(self, iid):
+        """Removes a single row from the Treeview if it is currently shown."""
+        if self._tree_state.pop(iid, None) is not None:
+            self._suppress_select_events()
+            self.tree.delete(iid)
+
+    def _suppress_select_events(self):
+        """Makes on_tree_select ignore the selection events of a programmatic refresh.
+
+        Tk queues <<TreeviewSelect>>, so it is delivered after the refresh returns;
+        the flag is cleared from an idle callback, which runs once pending events are handled.
+        """
+        if not self._suppress_select:
+            self._suppress_select = True
+            self.root.after_idle(self._end_suppress_select)
+
+    def _end_suppress_select(self):
+        self._suppress_select = False
+
+    def _render_rows(self, rows):
+        """Makes the Treeview show exactly the given (iid, values) rows, in order.
+
+        self._tree_state remembers the values last shown per iid, so this diffs
+        against it: unchanged rows are skipped, changed rows get tree.item, new rows
+        are inserted and rows no longer shown are deleted in a single call.
+        When many rows are inserted, updated or moved at once (startup, load, sort,
+        clearing a filter) the columns are hidden for the duration so Tk does not
+        re-layout per row operation.
         """
-        for r in self.tree.get_children():
-            self.tree.delete(r)
-        for i, item in enumerate(self.inventory):
-            self.tree.insert("", tk.END, iid=str(i), values=(
-                item.get("product_number", ""),
-                item.get("name", ""),
-                item.get("category", ""),
-                item.get("quantity", "0"),
-            ))
+        state = self._tree_state
+        new_state = {}
+        for iid, vals in rows:
+            new_state[iid] = vals
+        self._suppress_select_events()
+
+        gone = [iid for iid in state if iid not in new_state]
+        # Tk order after the deletes: surviving rows as before, inserts appended at the end
+        current = [iid for iid in state if iid in new_state]
+        changed = [iid for iid in current if state[iid] != new_state[iid]]
+        added = [iid for iid in new_state if iid not in state]
+        current += added
+        order = list(new_state)
+        # rows before the first out-of-place one are already where they belong
+        start = next((pos for pos, (a, b) in enumerate(zip(current, order)) if a != b), len(order))
+
+        bulk = len(added) + len(changed) + len(order) - start >= BULK_RENDER_ROWS
+        if bulk:
+            self.tree.configure(displaycolumns=())
+        try:
+            if gone:
+                self.tree.delete(*gone)
+            for iid in added:
+                self.tree.insert("", tk.END, iid=iid, values=new_state[iid])
+            for iid in changed:
+                self.tree.item(iid, values=new_state[iid])
+            for pos in range(start, len(order)):
+                self.tree.move(order[pos], "", pos)
+        finally:
+            if bulk:
+                self.tree.configure(displaycolumns="#all")
+        self._tree_state = new_state
+
+    # --------------------------------------------------------------------------------------------------------------
+    # INDEXES: These methods keep derived lookup structures in step with self.inventory.
+    # --------------------------------------------------------------------------------------------------------------
+    def _rebuild_indexes(self):
+        """Rebuilds every derived index from self.inventory.
+
+        This is called whenever the list is replaced (startup, load, clear), which also
+        gives every row a fresh iid; sort permutes the columns along with the items and
+        single-item changes patch the indexes through the _index_* methods instead.
+        """
+        self._summary_cache = None
+        self._data_version += 1
+        inventory = self.inventory
+        self.cols = {name: [fn(it) for it in inventory] for name, fn in INDEX_COLUMNS.items()}
+        self.cols["iid"] = [uuid.uuid4().hex for _ in inventory]
+        self._category_counts = Counter(self._category_key(it) for it in self.inventory)
+        self._rebuild_lookups()
+
+    def _rebuild_lookups(self):
+        """Rebuilds the position dicts: name and product number (O(1) uniqueness checks)
+        and iid (selection -> index), plus the per-key row counts."""
+        self._by_name_lower = {}
+        self._by_prodnum = {}
+        for i, (name, prodnum) in enumerate(zip(self.cols["name_key"], self.cols["prodnum_key"])):
+            self._by_name_lower.setdefault(name, i)
+            self._by_prodnum.setdefault(prodnum, i)
+        self._name_counts = Counter(self.cols["name_key"])
+        self._prodnum_counts = Counter(self.cols["prodnum_key"])
+        self._iid_to_index = {iid: i for i, iid in enumerate(self.cols["iid"])}
+
+    def _category_key(self, item):
+        """Returns the stripped category used to count items per category."""
+        return field_text(item, "category").strip()
+
+    def _count_category(self, category, delta):
+        """Adjusts the item count of a category, dropping it when it reaches zero."""
+        self._count_key(self._category_counts, category, delta)
+
+    @staticmethod
+    def _count_key(counts, key, delta):
+        """Adjusts a per-key row count, dropping the key when it reaches zero."""
+        counts[key] += delta
+        if counts[key] <= 0:
+            del counts[key]
+
+    def _index_append(self, item):
+        """Adds the indexes for an item just appended to self.inventory."""
+        idx = len(self.inventory) - 1
+        for name, fn in INDEX_COLUMNS.items():
+            self.cols[name].append(fn(item))
+        self._count_category(self._category_key(item), 1)
+        self._by_name_lower.setdefault(self.cols["name_key"][idx], idx)
+        self._by_prodnum.setdefault(self.cols["prodnum_key"][idx], idx)
+        self._name_counts[self.cols["name_key"][idx]] += 1
+        self._prodnum_counts[self.cols["prodnum_key"][idx]] += 1
+        iid = uuid.uuid4().hex
+        self.cols["iid"].append(iid)
+        self._iid_to_index[iid] = idx
+
+    def _index_update(self, idx, old):
+        """Refreshes the indexes for self.inventory[idx] after it was edited in place.
+
+        old is a copy of the item taken before the edit, used to drop its stale keys.
+        """
+        item = self.inventory[idx]
+        for name, fn in INDEX_COLUMNS.items():
+            self.cols[name][idx] = fn(item)
+        old_cat, new_cat = self._category_key(old), self._category_key(item)
+        if old_cat != new_cat:
+            self._count_category(old_cat, -1)
+            self._count_category(new_cat, 1)
+        self._rekey(self._by_name_lower, self._name_counts, self.cols["name_key"], idx, name_key(old))
+        self._rekey(self._by_prodnum, self._prodnum_counts, self.cols["prodnum_key"], idx, prodnum_key(old))
+
+    def _rekey(self, lookup, counts, keys, idx, old_key):
+        """Updates one of the position dicts after row idx changed its key from old_key to keys[idx].
+
+        Both keys keep pointing at their first matching row (first match wins):
+        old_key moves on to the next row that still has it, the new key takes idx only
+        if no earlier row has it. With unique keys (the usual case) counts shows that no
+        other row has old_key, so nothing is scanned; otherwise the next one is found
+        with list.index over the key column.
+        """
+        new_key = keys[idx]
+        if old_key == new_key:
+            return
+        self._count_key(counts, old_key, -1)
+        counts[new_key] += 1
+        if lookup.get(old_key) == idx:
+            if old_key in counts:
+                lookup[old_key] = keys.index(old_key, idx + 1)
+            else:
+                del lookup[old_key]
+        lookup[new_key] = min(lookup.get(new_key, idx), idx)
+
+    def _index_delete(self, idx, item):
+        """Drops the indexes for the item just deleted from self.inventory[idx].
+
+        Only the items after idx shift down by one, so only their entries in the
+        position dicts are renumbered (O(items after idx) instead of a full rebuild).
+        """
+        del self._iid_to_index[self.cols["iid"][idx]]
+        removed_keys = (self.cols["name_key"][idx], self.cols["prodnum_key"][idx])
+        for col in self.cols.values():
+            del col[idx]
+        self._count_category(self._category_key(item), -1)
+
+        for lookup, counts, keys, removed in (
+                (self._by_name_lower, self._name_counts, self.cols["name_key"], removed_keys[0]),
+                (self._by_prodnum, self._prodnum_counts, self.cols["prodnum_key"], removed_keys[1])):
+            self._count_key(counts, removed, -1)
+            # entries pointing before idx are unaffected (first match wins); drop the rest
+            # and re-add them from the shifted rows
+            suffix = keys[idx:]
+            for key in [removed] + suffix:
+                if lookup.get(key, -1) >= idx:
+                    del lookup[key]
+            for j, key in enumerate(suffix, idx):
+                lookup.setdefault(key, j)
+        iids = self.cols["iid"]
+        for j in range(idx, len(iids)):
+            self._iid_to_index[iids[j]] = j
+
+    def _filter_by_keyword(self, keyword):
+        """Returns the indices of the items whose name or product number contains the (lowercased) keyword."""
+        pairs = zip(self.cols["name_lower"], self.cols["prodnum_lower"])
+        return [i for i, (n, p) in enumerate(pairs) if keyword in n or keyword in p]
 
     def _get_selected_index(self):
         """Returning the index of the currently selected row in the Treeview or None.
 
-        This handles both integer iids and cases where a filtered view may have non-integer iids.
+        Rows use the item's stable iid, mapped back to its position by self._iid_to_index.
         """
         sel = self.tree.selection()
         if not sel:
             return None
         iid = sel[0]
-        try:
-            return int(iid)
-        except Exception:
-            # fallback: try to map by unique name in the selected row
-            vals = self.tree.item(iid).get("values", [])
-            # expected values: [prod#, name, category, qty]
-            name = ""
-            if len(vals) >= 2:
-                name = str(vals[1])
-            elif len(vals) == 1:
-                name = str(vals[0])
-            if name:
-                idx = linear_search(self.inventory, name)
-                return idx if idx != -1 else None
-            return None
+        idx = self._iid_to_index.get(iid)
+        if idx is not None:
+            return idx
+        # fallback: map by the product number shown in the row (unique, unlike names).
+        # tree.set returns the cell text as-is; item()["values"] would turn "007" into 7
+        prodnum = str(self.tree.set(iid, "product_number")).strip()
+        return self._by_prodnum.get(prodnum) if prodnum else None
 
     # --------------------------------------------------------------------------------------------------------------
     # CORE CRUD OPERATIONS: These methods implement the Create, Read, Update, Delete operations.
@@ -387,7 +907,7 @@ class GyeonInventoryApp:
         """Adds a new item or increase quantity if name already exists.
 
         This validates inputs, demonstrates 'add' operation on the list structure
-        and uses linear_search for checking existing items.
+        and uses the name/product-number dicts (O(1)) for checking existing items.
         """
         name = self.name_entry.get().strip()
         category = self.cat_entry.get().strip()
@@ -397,42 +917,51 @@ class GyeonInventoryApp:
         if not name or not qty:
             messagebox.showwarning("Input Error", "Name and Quantity are required.")
             return
-        if not qty.isdigit():
+        quantity = parse_quantity(qty)
+        if quantity is None:
             messagebox.showwarning("Input Error", "Quantity must be an integer.")
             return
         if not prodnum:
             messagebox.showwarning("Input Error", "Product Number is required.")
             return
 
-        idx = linear_search(self.inventory, name)
+        idx = self._by_name_lower.get(name.strip().lower(), -1)
         if idx != -1:
             # Found existing item: ask to increment or cancel
             if messagebox.askyesno("Item Exists", f"'{name}' exists. Add quantity to existing item?"):
-                self.inventory[idx]["quantity"] = str(int(self.inventory[idx]["quantity"]) + int(qty))
+                # start from the column value so an unparseable stored quantity counts as 0
+                total = self.cols["quantity"][idx] + quantity
+                if total > MAX_QUANTITY:
+                    messagebox.showwarning("Input Error", "Quantity must be an integer.")
+                    return
+                self.inventory[idx]["quantity"] = total
+                self.cols["quantity"][idx] = total
+                self._update_row(self.cols["iid"][idx], self._row_values(self.inventory[idx]))
+                self._mark_dirty(("update", idx, self.inventory[idx]))
             else:
                 messagebox.showinfo("Cancelled", "Add operation cancelled.")
                 return
         else:
             # Before appending, ensure product number (if provided) is unique
-            if prodnum:
-                for itm in self.inventory:
-                    if itm.get("product_number", "").strip() == prodnum:
-                        messagebox.showwarning(
-                            "Duplicate Product Number",
-                            f"Product number '{prodnum}' already exists. Please use a unique product number."
-                        )
-                        return
+            if prodnum and prodnum in self._by_prodnum:
+                messagebox.showwarning(
+                    "Duplicate Product Number",
+                    f"Product number '{prodnum}' already exists. Please use a unique product number."
+                )
+                return
 
             # Append demonstrates list 'add' behavior
             new_item = {
                 "product_number": prodnum,
                 "name": name,
-                "category": category,
-                "quantity": str(qty)
+                "category": sys.intern(category),
+                "quantity": quantity
             }
             self.inventory.append(new_item)
+            self._index_append(new_item)
+            self._insert_row(self.cols["iid"][-1], self._row_values(new_item))
+            self._mark_dirty(("add", None, new_item))
 
-        self.refresh_table()
         self._clear_inputs()
 
     def update_selected(self):
@@ -450,30 +979,34 @@ class GyeonInventoryApp:
         qty = self.qty_entry.get().strip()
         prodnum = self.product_entry.get().strip()
 
+        # Validate everything first so a rejected update leaves the item (and indexes) untouched
+        # Ensure new product number does not clash with another item
+        if prodnum and prodnum in self._by_prodnum and self._by_prodnum[prodnum] != idx:
+            messagebox.showwarning(
+                "Duplicate Product Number",
+                f"Product number '{prodnum}' already exists for another item."
+            )
+            return
+        quantity = parse_quantity(qty) if qty else None
+        if qty and quantity is None:
+            messagebox.showwarning("Input Error", "Quantity must be an integer.")
+            return
+
         item = self.inventory[idx]
+        old = dict(item)
         if name:
             item["name"] = name
         if category:
-            item["category"] = category
+            item["category"] = sys.intern(category)
         if prodnum:
-            # Ensure new product number does not clash with another item
-            for i, it in enumerate(self.inventory):
-                if i != idx and it.get("product_number", "").strip() == prodnum:
-                    messagebox.showwarning(
-                        "Duplicate Product Number",
-                        f"Product number '{prodnum}' already exists for another item."
-                    )
-                    return
-
             item["product_number"] = prodnum
         if qty:
-            if not qty.isdigit():
-                messagebox.showwarning("Input Error", "Quantity must be an integer.")
-                return
-            item["quantity"] = str(qty)
+            item["quantity"] = quantity
+        self._index_update(idx, old)
+        self._mark_dirty(("update", idx, item))
 
-        # Update view and clear inputs to avoid accidental edits
-        self.refresh_table()
+        # Update the edited row only and clear inputs to avoid accidental edits
+        self._update_row(self.cols["iid"][idx], self._row_values(item))
         self._clear_inputs()
 
     def delete_selected(self):
@@ -485,8 +1018,12 @@ class GyeonInventoryApp:
         item = self.inventory[idx]
         if messagebox.askyesno("Confirm Delete", f"Delete '{item.get('name')}' from inventory?"):
             # delete shifts subsequent elements left automatically in list
+            iid = self.cols["iid"][idx]
             del self.inventory[idx]
-            self.refresh_table()
+            self._index_delete(idx, item)
+            self._mark_dirty(("delete", idx, None))
+            # iids are stable, so only the deleted row leaves the Treeview
+            self._delete_row(iid)
 
     def search_item(self):
         """Searches inventory by partial keyword and display matching items.
@@ -496,9 +1033,7 @@ class GyeonInventoryApp:
             return
 
         keyword = keyword.strip().lower()
-        filtered = [item for item in self.inventory
-                if keyword in item.get("name", "").lower()
-                or keyword in item.get("product_number", "").lower()]
+        filtered = self._filter_by_keyword(keyword)
 
         # Update tree to show filtered results
         self.refresh_treeview(filtered)
@@ -506,60 +1041,62 @@ class GyeonInventoryApp:
         messagebox.showinfo("Search Results", f"Found {len(filtered)} item(s) matching '{keyword}'.")
 
     def realtime_filter(self, event=None):
-        """Filter items as user types into the search bar."""
+        """Filter items as user types into the search bar.
+
+        The filter is debounced: each keystroke cancels the pending run and schedules
+        a new one FILTER_DELAY_MS later, so a burst of typing refreshes the table once.
+        """
+        if self._filter_after_id:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(FILTER_DELAY_MS, self._do_filter)
+
+    def _do_filter(self):
+        """Runs the search-bar filter and refreshes the Treeview with the matches."""
+        self._filter_after_id = None
         keyword = self.search_var.get().strip().lower()
         if keyword == "":
             self.refresh_treeview()
             return
-        filtered = [item for item in self.inventory
-                    if keyword in item.get("name", "").lower()
-                    or keyword in item.get("product_number", "").lower()]
-        self.refresh_treeview(filtered)
+        self.refresh_treeview(self._filter_by_keyword(keyword))
 
-    def refresh_treeview(self, data=None):
-        """Refresh Treeview with full inventory or filtered list.
+    def refresh_treeview(self, indices=None):
+        """Refresh Treeview with full inventory or the filtered rows at the given indices.
 
-        Ensures 4-column values and sets iids that map back to self.inventory indices.
+        Ensures 4-column values and uses each row's stable iid (see _iid_to_index).
         """
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-
-        if data is None:
-            # full view: set iid to inventory index
-            for i, item in enumerate(self.inventory):
-                self.tree.insert("", tk.END, iid=str(i), values=(
-                    item.get("product_number", ""),
-                    item.get("name", ""),
-                    item.get("category", ""),
-                    item.get("quantity", "0"),
-                ))
-        else:
-            # filtered view: try to preserve mapping by using the index in the main inventory
-            for item in data:
-                try:
-                    i = self.inventory.index(item)
-                    iid = str(i)
-                except ValueError:
-                    iid = None
-                vals = (
-                    item.get("product_number", ""),
-                    item.get("name", ""),
-                    item.get("category", ""),
-                    item.get("quantity", "0"),
-                )
-                if iid is not None:
-                    self.tree.insert("", tk.END, iid=iid, values=vals)
-                else:
-                    self.tree.insert("", tk.END, values=vals)
+        if indices is None:
+            # full view
+            self.refresh_table()
+            return
+        # filtered view: the iid column is indexed like the inventory, so no lookup is needed
+        iids, inventory = self.cols["iid"], self.inventory
+        self._rendered_version = None
+        self._render_rows((iids[i], self._row_values(inventory[i])) for i in indices)
 
     def sort_items(self, key):
-        """Sort inventory in-place using bubble_sort and refresh table.
+        """Sort inventory in-place using argsort (Timsort) and refresh table.
 
         the key may be 'name', 'quantity', 'category', or 'product_number'.
+        bubble_sort is kept above for teaching; the UI uses the O(n log n) built-in sort.
+        Name, product number and quantity keys come straight from the index columns,
+        and the columns are permuted along with the items instead of being rebuilt.
+        Rows keep their iids, so the refresh only moves rows (no delete/insert).
         """
-        if key not in ("name", "quantity", "category", "product_number"):
+        if key not in SORT_KEYS:
             return
-        bubble_sort(self.inventory, key=key)
+        if key == "name":
+            keys = self.cols["name_lower"]
+        elif key == "product_number":
+            keys = self.cols["prodnum_lower"]
+        elif key == "quantity":
+            keys = self.cols["quantity"]
+        else:
+            keys = [CATEGORY_SORT_KEY(it) for it in self.inventory]
+        order = argsort(keys)
+        self.inventory[:] = [self.inventory[i] for i in order]
+        self.cols = {name: [col[i] for i in order] for name, col in self.cols.items()}
+        self._rebuild_lookups()
+        self._mark_dirty()
         self.refresh_table()
 
     def filter_by_category(self):
@@ -569,8 +1106,8 @@ class GyeonInventoryApp:
         categories found in the inventory. Selecting OK filters the table to that
         category; Cancel or closing the dialog keeps the current view.
         """
-        # gather present categories from inventory (non-empty, stripped)
-        present = sorted({(it.get("category", "") or "").strip() for it in self.inventory if it.get("category")})
+        # present categories (non-empty, stripped) come from the maintained per-category counts
+        present = sorted(c for c in self._category_counts if c)
         # create ordered options: CATEGORY_ORDER first, then other present categories
         options = [c for c in CATEGORY_ORDER if c] + [c for c in present if c and c not in CATEGORY_ORDER]
 
@@ -618,7 +1155,9 @@ class GyeonInventoryApp:
         if not sel:
             return
 
-        filtered = [item for item in self.inventory if item.get("category", "").strip().lower() == sel.lower()]
+        # compare against the maintained lowercase category column, lowering sel only once
+        sel_lower = sel.strip().lower()
+        filtered = [i for i, c in enumerate(self.cols["cat_lower"]) if c == sel_lower]
         self.refresh_treeview(filtered)
         messagebox.showinfo("Filter Results", f"Showing {len(filtered)} item(s) in category '{sel}'.")
 
@@ -627,6 +1166,9 @@ class GyeonInventoryApp:
     # --------------------------------------------------------------------------------------------------------------
     def on_tree_select(self, event):
         """Populates the input fields with the selected row for convenient editing."""
+        if self._suppress_select:
+            # selection changed by a refresh, not by the user
+            return
         idx = self._get_selected_index()
         if idx is None:
             return
@@ -642,17 +1184,56 @@ class GyeonInventoryApp:
             self.cat_entry.delete(0, tk.END)
             self.cat_entry.insert(0, item.get("category", ""))
         self.qty_entry.delete(0, tk.END)
-        self.qty_entry.insert(0, item.get("quantity", ""))
+        self.qty_entry.insert(0, str(item.get("quantity", "")))
 
     # --------------------------------------------------------------------------------------------------------------
     # FILE OPERATIONS: These methods handle saving, loading, and exporting inventory data.
     # --------------------------------------------------------------------------------------------------------------
     def save_inventory(self):
-        """Saves current inventory to the dedicated GYEON file with atomic write."""
+        """Saves current inventory to the dedicated GYEON file with atomic write.
+
+        Nothing is written when the inventory has not changed since the last save/load.
+        If the only changes are single-row adds/updates/deletes, they are appended to
+        JOURNAL_FILE instead of rewriting the whole data file. A full save whose bytes hash the same as the
+        last full save (e.g. sorted and sorted back) skips the write too. A journal that does not
+        match the data file forces a full save and is set aside rather than deleted.
+        """
+        if not self._dirty and os.path.exists(DATA_FILE):
+            messagebox.showinfo("Saved", f"No changes since the last save. Inventory is up to date in: {DATA_FILE}")
+            return
         try:
-            # save_to_file will create the folder/file if necessary
-            save_to_file(DATA_FILE, self.inventory)
-            messagebox.showinfo("Saved", f"Inventory saved to: {DATA_FILE}")
+            has_journal = os.path.exists(JOURNAL_FILE)
+            # decided before any write: a full save changes the data file's hash
+            journal_ok = has_journal and journal_is_current(DATA_FILE, JOURNAL_FILE)
+            can_append = os.path.exists(DATA_FILE) and (not has_journal or journal_ok)
+            if not self._needs_full_save and can_append:
+                save_append(JOURNAL_FILE, self._unsaved_ops, DATA_FILE)
+                # the data file alone no longer describes the saved state
+                self._last_saved_hash = None
+                msg = (f"Changes appended to the journal: {JOURNAL_FILE}\n"
+                       f"They are folded into {DATA_FILE} when the window closes.")
+            else:
+                data = dump_json(self.inventory)
+                digest = content_hash(data)
+                last = self._last_saved_hash
+                unchanged = (last is not None and last[0] == digest and os.path.exists(DATA_FILE)
+                             and os.stat(DATA_FILE).st_mtime_ns == last[1])
+                if not unchanged:
+                    # write_atomic will create the folder/file if necessary
+                    write_atomic(DATA_FILE, data)
+                    self._last_saved_hash = (digest, os.stat(DATA_FILE).st_mtime_ns)
+                msg = f"Inventory saved to: {DATA_FILE}"
+                if journal_ok:
+                    # the full file now includes everything the journal held
+                    with contextlib.suppress(OSError):
+                        os.unlink(JOURNAL_FILE)
+                elif has_journal:
+                    # a journal for different file contents: keep it for the user, out of the way
+                    aside = f"{JOURNAL_FILE}.{time.strftime('%Y%m%d-%H%M%S')}.unapplied"
+                    os.replace(JOURNAL_FILE, aside)
+                    msg += f"\nAn older change journal did not match the data file and was kept as: {aside}"
+            self._mark_saved()
+            messagebox.showinfo("Saved", msg)
         except Exception as e:
             messagebox.showerror("Save Error", str(e))
 
@@ -663,7 +1244,7 @@ class GyeonInventoryApp:
         list to reflect persistent storage.
         """
         try:
-            data = load_from_file(DATA_FILE)
+            data = load_from_file(DATA_FILE, JOURNAL_FILE)
             # Support both old-format (list) and new export-format (dict with 'inventory')
             if isinstance(data, dict) and "inventory" in data:
                 loaded = data.get("inventory") or []
@@ -673,66 +1254,101 @@ class GyeonInventoryApp:
                 messagebox.showerror("Load Error", "Unexpected data format in inventory file.")
                 return
 
-            # Validate items: keep only dict entries to avoid 'str' has no attribute 'get' errors
-            cleaned = []
-            skipped = 0
-            for it in loaded:
-                if isinstance(it, dict):
-                    cleaned.append(it)
-                else:
-                    skipped += 1
-
+            # Validate items: keep only dict entries to avoid 'str' has no attribute 'get' errors.
+            # The bound check is a local inside the comprehension; skipped is just the length difference
+            is_dict = dict.__instancecheck__
+            cleaned = [it for it in loaded if is_dict(it)]
+            skipped = len(loaded) - len(cleaned)
+
+            # only commit the new list once its indexes are built. _rebuild_indexes replaces
+            # these objects rather than mutating them, so on failure the previous ones are put
+            # back untouched (same iids as the rows on screen)
+            previous = (self.inventory, self.cols, self._category_counts, self._by_name_lower,
+                        self._by_prodnum, self._name_counts, self._prodnum_counts, self._iid_to_index,
+                        self._summary_cache, self._data_version)
             self.inventory = cleaned
-            self.refresh_table()
+            try:
+                self._rebuild_indexes()
+            except Exception:
+                (self.inventory, self.cols, self._category_counts, self._by_name_lower,
+                 self._by_prodnum, self._name_counts, self._prodnum_counts, self._iid_to_index,
+                 self._summary_cache, self._data_version) = previous
+                raise
+            self._mark_saved()
+            if skipped:
+                # journal records address rows by position in the file; with rows dropped the
+                # positions no longer line up, so the next save has to rewrite the file
+                self._needs_full_save = True
+            self._schedule_refresh()
             msg = f"Inventory loaded from: {DATA_FILE}."
             if skipped:
                 msg += f"\n{skipped} invalid item(s) were skipped during load."
+            if os.path.exists(JOURNAL_FILE) and not journal_is_current(DATA_FILE, JOURNAL_FILE):
+                msg += (f"\nThe change journal {JOURNAL_FILE} does not match the data file and was not applied;"
+                        " it is kept and set aside on the next save.")
             messagebox.showinfo("Loaded", msg)
+        except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so this covers both parsers
+            messagebox.showerror("Load Error", f"The inventory file is not valid JSON:\n{e}")
         except Exception as e:
             messagebox.showerror("Load Error", str(e))
 
+    def _get_summary(self):
+        """Returns the export summary (totals and per-category breakdown) of the inventory.
+
+        The result is cached in self._summary_cache until the inventory changes
+        (_mark_dirty / _rebuild_indexes clear it), so repeated exports skip the scan.
+        Totals are taken straight from the index columns. The rows are stably sorted by
+        category (in order of first appearance, as before) and grouped with groupby, so
+        each category's count and statement list come out of one pass over its group.
+        """
+        if self._summary_cache is not None:
+            return self._summary_cache
+        cols = self.cols
+        total_items = len(self.inventory)
+        total_quantity = sum(cols["quantity"])
+        cats = cols["category"]
+        rank = {cat: i for i, cat in enumerate(dict.fromkeys(cats))}
+        rows = sorted(zip(cats, cols["product_number"], cols["name"], cols["quantity"]),
+                      key=lambda row: rank[row[0]])
+        by_category_counts = {}
+        by_category_products = {}
+        for cat, group in groupby(rows, key=itemgetter(0)):
+            # readable product statement per category
+            stmts = [f"{prodnum} — {name} (Qty: {q})" for _, prodnum, name, q in group]
+            by_category_counts[cat] = len(stmts)
+            by_category_products[cat] = stmts
+
+        self._summary_cache = {
+            "total_items": total_items,
+            "total_quantity": total_quantity,
+            "by_category_counts": by_category_counts,
+            "by_category_products": by_category_products,
+        }
+        return self._summary_cache
+
     def export_as(self):
         """Exports the inventory to a user-specified JSON file via a save dialog."""
+        if not self.inventory:
+            messagebox.showinfo("Export", "Inventory is empty.")
+            return
         path = filedialog.asksaveasfilename(defaultextension=".json",
                                             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
                                             title="Export inventory as...")
         if not path:
             return
         try:
-            # Build export payload with metadata summary and timestamp
-            exported_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            total_items = len(self.inventory)
-            total_quantity = 0
-            by_category_counts = {}
-            by_category_products = {}
-            for it in self.inventory:
-                try:
-                    q = int(it.get("quantity", 0))
-                except Exception:
-                    q = 0
-                total_quantity += q
-                cat = (it.get("category") or "").strip() or "Uncategorized"
-                # counts
-                by_category_counts[cat] = by_category_counts.get(cat, 0) + 1
-                # readable product statement per category
-                prodnum = (it.get("product_number") or "").strip() or "N/A"
-                name = (it.get("name") or "").strip() or "Unnamed"
-                stmt = f"{prodnum} — {name} (Qty: {q})"
-                by_category_products.setdefault(cat, []).append(stmt)
-
+            # Build export payload with metadata summary and timestamp;
+            # the datetime itself goes to dump_json, which writes it as ISO 8601
+            exported_at = datetime.now()
             export_data = {
                 "Inventory updated as of": exported_at,
-                "summary": {
-                        "total_items": total_items,
-                        "total_quantity": total_quantity,
-                        "by_category_counts": by_category_counts,
-                        "by_category_products": by_category_products,
-                },
+                "summary": self._get_summary(),
                 "inventory": self.inventory,
             }
 
             save_to_file(path, export_data)
-            messagebox.showinfo("Exported", f"Inventory exported to: {path}\nExport time: {exported_at}")
+            messagebox.showinfo("Exported", f"Inventory exported to: {path}\nExport time: {exported_at:%Y-%m-%d %H:%M:%S}")
         except Exception as e:
             messagebox.showerror("Export Error", str(e))
 
@@ -749,17 +1365,50 @@ class GyeonInventoryApp:
             self.cat_entry.delete(0, tk.END)
         self.qty_entry.delete(0, tk.END)
 
+    def _mark_dirty(self, op=None):
+        """Flags the inventory as changed since the last save/load.
+
+        Pass the change as an (op, index, item) journal entry (see save_append) for a
+        single-row add/update/delete; without one (sort, clear) the next save is a full save.
+        """
+        self._dirty = True
+        self._summary_cache = None
+        self._data_version += 1
+        if op is not None:
+            self._unsaved_ops.append(op)
+        else:
+            self._needs_full_save = True
+
+    def _mark_saved(self):
+        """Records that memory and disk agree again (after a save or load)."""
+        self._dirty = False
+        self._unsaved_ops = []
+        self._needs_full_save = False
+
+    def _on_close(self):
+        """Folds the journal into the data file, then closes the window.
+
+        Unsaved changes are not written, same as before; only already-saved changes are compacted.
+        """
+        try:
+            compact_journal(DATA_FILE, JOURNAL_FILE)
+        except Exception:
+            # the journal is simply replayed on the next load instead
+            pass
+        self.root.destroy()
+
     def clear_all(self):
         """Clears entire inventory after user confirmation - also removes saved file."""
         if not messagebox.askyesno("Confirm", "Clear ALL inventory? This cannot be undone."):
             return
         self.inventory = []
-        self.refresh_table()
-        try:
-            if os.path.exists(DATA_FILE):
-                os.remove(DATA_FILE)
-        except Exception:
-            pass
+        self._rebuild_indexes()
+        self._mark_dirty()
+        self._schedule_refresh()
+        # a missing file is fine; removal is best effort, as before
+        for path in (DATA_FILE, JOURNAL_FILE):
+            with contextlib.suppress(OSError):
+                os.unlink(path)
 
 # --------------------------------------------------------------------------------------------------------------
 # RUNNING THE APPLICATION: This block starts the Tkinter main loop.